@@ -0,0 +1,106 @@
+#!/usr/bin/env npx tsx
+/**
+ * Build script for the flattened corpus manifest
+ *
+ * Walks tests/corpus/, joins each fixture with its expected detections
+ * from manifest.json, and emits tests/corpus/corpus.jsonl — one JSON
+ * record per fixture with the source embedded. Consumers get the whole
+ * labeled corpus in a single sequential read instead of one open() per
+ * fixture plus ad-hoc manifest lookups.
+ *
+ * The .py/.ts fixture files remain the human-editable sources; rerun
+ * this script after editing them or manifest.json.
+ *
+ * Usage: npx tsx scripts/build-corpus-manifest.ts (or: npm run corpus:build)
+ */
+
+import { readFile, readdir, writeFile } from "fs/promises";
+import { join, relative } from "path";
+
+const CORPUS_DIR = join(process.cwd(), "tests/corpus");
+const MANIFEST_PATH = join(CORPUS_DIR, "manifest.json");
+const OUTPUT_PATH = join(CORPUS_DIR, "corpus.jsonl");
+
+/**
+ * Fixture extensions included in the corpus
+ */
+const FIXTURE_EXTENSIONS = [".py", ".ts", ".tsx", ".js", ".jsx"];
+
+interface ExpectedDetection {
+  category: string;
+  line: number;
+  patternId: string;
+}
+
+interface CorpusRecord {
+  /** Path relative to tests/corpus, POSIX-style (matches manifest keys) */
+  path: string;
+  /** Whether the fixture is a labeled-safe or labeled-vulnerable sample */
+  label: "safe" | "vulnerable";
+  /** Expected detections from manifest.json (empty for safe fixtures) */
+  expected: ExpectedDetection[];
+  /** Full fixture source */
+  source: string;
+}
+
+async function collectFixtures(dir: string): Promise<string[]> {
+  const entries = await readdir(dir, { withFileTypes: true });
+  const files: string[] = [];
+
+  for (const entry of entries) {
+    const fullPath = join(dir, entry.name);
+    if (entry.isDirectory()) {
+      files.push(...(await collectFixtures(fullPath)));
+    } else if (FIXTURE_EXTENSIONS.some((ext) => entry.name.endsWith(ext))) {
+      files.push(fullPath);
+    }
+  }
+
+  return files;
+}
+
+async function main(): Promise<void> {
+  console.log("Building corpus.jsonl...\n");
+
+  const manifestContent = await readFile(MANIFEST_PATH, "utf8");
+  const manifest = JSON.parse(manifestContent) as Record<string, ExpectedDetection[]>;
+
+  const safeFiles = await collectFixtures(join(CORPUS_DIR, "safe"));
+  const vulnerableFiles = await collectFixtures(join(CORPUS_DIR, "vulnerable"));
+
+  const records: CorpusRecord[] = [];
+
+  for (const file of [...safeFiles, ...vulnerableFiles].sort()) {
+    const path = relative(CORPUS_DIR, file).split("\\").join("/");
+    const source = await readFile(file, "utf8");
+
+    records.push({
+      path,
+      label: path.startsWith("safe/") ? "safe" : "vulnerable",
+      expected: manifest[path] ?? [],
+      source,
+    });
+  }
+
+  // Warn about manifest entries with no fixture on disk
+  const recordPaths = new Set(records.map((r) => r.path));
+  for (const manifestPath of Object.keys(manifest)) {
+    if (!recordPaths.has(manifestPath)) {
+      console.warn(`Warning: manifest entry has no fixture on disk: ${manifestPath}`);
+    }
+  }
+
+  const lines = records.map((r) => JSON.stringify(r));
+  await writeFile(OUTPUT_PATH, lines.join("\n") + "\n", "utf8");
+
+  console.log(`Wrote ${records.length} records to ${OUTPUT_PATH}`);
+  const labeled = records.filter((r) => r.expected.length > 0).length;
+  console.log(`  Safe: ${records.filter((r) => r.label === "safe").length}`);
+  console.log(`  Vulnerable: ${records.filter((r) => r.label === "vulnerable").length}`);
+  console.log(`  With expected detections: ${labeled}`);
+}
+
+main().catch((error) => {
+  console.error("Corpus build failed:", error);
+  process.exit(1);
+});
@@ -72,6 +72,11 @@ interface QueryMatch {
   }>;
 }
 
+/**
+ * Maximum parsed trees kept in an AstPatternMatcher's source cache
+ */
+const MAX_TREE_CACHE_ENTRIES = 256;
+
 /**
  * Cached parser instances per language
  */
@@ -396,6 +401,13 @@ export class AstPatternMatcher {
 
     const result = await parseSource(source, language);
     if (result.success && cacheKey) {
+      // Bound the cache so long scans don't retain a tree per file forever
+      if (this.sourceCache.size >= MAX_TREE_CACHE_ENTRIES) {
+        const oldest = this.sourceCache.keys().next().value;
+        if (oldest !== undefined) {
+          this.sourceCache.delete(oldest);
+        }
+      }
       this.sourceCache.set(cacheKey, result.data);
     }
 
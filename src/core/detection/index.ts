@@ -13,12 +13,15 @@ export {
   PatternMatcher,
   createPatternMatcher,
   detectLanguage,
+  extractRequiredLiteral,
   getSupportedExtensions,
   isExtensionSupported,
   type PatternMatcherOptions,
   type ScanOptions,
+  type CategoryPatterns,
   type PatternMatch,
   type FileScanResult,
+  type MultiCategoryFileScanResult,
   type AggregatedResults,
 } from "./pattern-matcher.js";
 
@@ -1,4 +1,6 @@
+import { createHash } from "crypto";
 import { readFile, readdir, stat } from "fs/promises";
+import { cpus } from "os";
 import { resolve, extname } from "path";
 
 import { DetectionResultSchema } from "../../categories/schema/index.js";
@@ -41,11 +43,278 @@ const EXTENSION_TO_LANGUAGE: Record<string, Language> = {
  */
 const MAX_FILE_SIZE = 10 * 1024 * 1024;
 
+/**
+ * Cache of compiled regexes shared across all PatternMatcher instances.
+ *
+ * Pattern sources come from category definitions and are reused for every
+ * file scanned, so compiling them once per process (instead of once per
+ * file) removes the dominant fixed cost of regex scanning. Invalid patterns
+ * are cached as null so they are reported once and not recompiled per file.
+ */
+const compiledRegexCache = new Map<string, RegExp | null>();
+
+/**
+ * Get a compiled regex from the cache, compiling on first use
+ *
+ * @param source - Regex source string
+ * @param flags - Regex flags (e.g., "gm")
+ * @returns Compiled regex, or null if the source is invalid
+ */
+function getCompiledRegex(source: string, flags: string): RegExp | null {
+  const key = `${flags}:${source}`;
+  const cached = compiledRegexCache.get(key);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  let regex: RegExp | null;
+  try {
+    regex = new RegExp(source, flags);
+  } catch (e) {
+    // Warn here, on first compile, so the null cache entry below keeps
+    // the failure from being re-reported for every file scanned
+    logger.child("PatternMatcher").warn(`Invalid regex pattern: ${source} (${e})`);
+    regex = null;
+  }
+
+  compiledRegexCache.set(key, regex);
+  return regex;
+}
+
+/**
+ * Build a monotonic table of line-start offsets for content
+ *
+ * Built once per file so match byte-offsets translate to line numbers
+ * via binary search instead of a character walk per match.
+ */
+function buildLineIndex(content: string): number[] {
+  const lineStarts = [0];
+  for (let i = content.indexOf("\n"); i !== -1; i = content.indexOf("\n", i + 1)) {
+    lineStarts.push(i + 1);
+  }
+  return lineStarts;
+}
+
+/**
+ * Get the 1-indexed line number containing the given character offset
+ */
+function lineFromOffset(lineStarts: number[], offset: number): number {
+  // Binary search for the rightmost line start <= offset
+  let lo = 0;
+  let hi = lineStarts.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (lineStarts[mid]! <= offset) {
+      lo = mid;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return lo + 1;
+}
+
+/**
+ * Cache of required-literal extractions keyed by pattern source
+ */
+const requiredLiteralCache = new Map<string, string | null>();
+
+/**
+ * Minimum literal length worth prefiltering on; shorter literals match
+ * almost everywhere and save nothing
+ */
+const MIN_PREFILTER_LITERAL_LENGTH = 3;
+
+/**
+ * Extract a literal substring that must appear in any match of a regex
+ *
+ * Used as a cheap prefilter: if the literal is absent from the file
+ * content, the regex cannot match and the engine never runs. The
+ * extraction is deliberately conservative — anything ambiguous
+ * (alternation, groups, classes, escapes like \\d) breaks the literal
+ * run or disqualifies the pattern entirely, returning null.
+ *
+ * @param source - Regex source string
+ * @returns A literal guaranteed to occur in every match, or null
+ */
+export function extractRequiredLiteral(source: string): string | null {
+  // Alternation anywhere means no single literal is guaranteed
+  if (source.includes("|")) {
+    return null;
+  }
+
+  let longest = "";
+  let current = "";
+
+  const commit = (): void => {
+    if (current.length > longest.length) {
+      longest = current;
+    }
+    current = "";
+  };
+
+  for (let i = 0; i < source.length; i++) {
+    const ch = source[i]!;
+
+    if (ch === "\\") {
+      const next = source[i + 1];
+      if (next !== undefined && !/[A-Za-z0-9]/.test(next)) {
+        // Escaped punctuation is a literal character
+        current += next;
+        i++;
+      } else if (next !== undefined && /[uxc0-9]/.test(next)) {
+        // Multi-character escape (\uXXXX, \xXX, \cX) or backreference:
+        // the operand spans a variable number of following characters,
+        // so the text after the escape cannot be trusted as literal —
+        // disqualify the whole pattern
+        return null;
+      } else {
+        // Class escape (\d, \w, \b, ...) breaks the run
+        commit();
+        i++;
+      }
+    } else if (ch === "?" || ch === "*" || ch === "{") {
+      // Quantifier makes the preceding character optional or repeated
+      current = current.slice(0, -1);
+      commit();
+      if (ch === "{") {
+        while (i < source.length && source[i] !== "}") i++;
+      }
+    } else if (ch === "+") {
+      // Preceding character occurs at least once, but repetition breaks
+      // contiguity with whatever follows
+      commit();
+    } else if (ch === "[") {
+      // Character class matches many characters; skip it
+      commit();
+      i++;
+      if (source[i] === "]") i++; // leading ] is a literal class member
+      while (i < source.length && source[i] !== "]") {
+        if (source[i] === "\\") i++;
+        i++;
+      }
+    } else if (ch === "(") {
+      // Group contents may be optional (e.g. followed by ?), so nothing
+      // inside counts toward a guaranteed literal; skip to the close
+      commit();
+      let depth = 1;
+      i++;
+      while (i < source.length && depth > 0) {
+        const gc = source[i];
+        if (gc === "\\") {
+          i++;
+        } else if (gc === "[") {
+          i++;
+          if (source[i] === "]") i++;
+          while (i < source.length && source[i] !== "]") {
+            if (source[i] === "\\") i++;
+            i++;
+          }
+        } else if (gc === "(") {
+          depth++;
+        } else if (gc === ")") {
+          depth--;
+        }
+        i++;
+      }
+      i--; // loop increment compensates
+    } else if (ch === ")" || ch === "." || ch === "^" || ch === "$") {
+      commit();
+    } else {
+      current += ch;
+    }
+  }
+
+  commit();
+  return longest.length >= MIN_PREFILTER_LITERAL_LENGTH ? longest : null;
+}
+
+/**
+ * Get the required literal for a pattern source, memoized
+ */
+function getRequiredLiteral(source: string): string | null {
+  const cached = requiredLiteralCache.get(source);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const literal = extractRequiredLiteral(source);
+  requiredLiteralCache.set(source, literal);
+  return literal;
+}
+
 /**
  * Maximum lines to include in snippet
  */
 const MAX_SNIPPET_LINES = 5;
 
+/**
+ * Maximum entries in the per-instance scan result cache
+ */
+const MAX_SCAN_CACHE_ENTRIES = 4096;
+
+/**
+ * Number of files scanned concurrently during directory scans, sized to
+ * the machine so file reads and async AST work overlap
+ */
+const SCAN_CONCURRENCY = Math.max(1, cpus().length);
+
+/**
+ * Map over items with a bounded number of in-flight promises
+ *
+ * Results are returned in input order regardless of completion order.
+ */
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let nextIndex = 0;
+
+  const workers = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    for (;;) {
+      const index = nextIndex++;
+      if (index >= items.length) {
+        break;
+      }
+      results[index] = await fn(items[index]!);
+    }
+  });
+
+  await Promise.all(workers);
+  return results;
+}
+
+/**
+ * Cached result of matching a pattern set against file content
+ *
+ * Matches are derived from the content, the extension-detected language,
+ * and the pattern set, so entries are keyed by exactly those three.
+ */
+interface ScanCacheEntry {
+  /** Detected language */
+  language: Language | null;
+  /**
+   * Pattern matches grouped by category ID. Stored and served as copies
+   * (map and arrays; the match objects are shared and never mutated) so
+   * callers that rearrange their scan result cannot poison later hits.
+   */
+  matchesByCategory: Map<string, PatternMatch[]>;
+}
+
+/**
+ * Copy a matches-by-category map, including its arrays
+ */
+function copyMatchesByCategory(
+  source: Map<string, PatternMatch[]>
+): Map<string, PatternMatch[]> {
+  const copy = new Map<string, PatternMatch[]>();
+  for (const [categoryId, matches] of source) {
+    copy.set(categoryId, [...matches]);
+  }
+  return copy;
+}
+
 /**
  * Options for pattern matching
  */
@@ -72,6 +341,16 @@ export interface ScanOptions extends PatternMatcherOptions {
   categoryId: string;
 }
 
+/**
+ * Patterns for a single category, used for combined multi-category scans
+ */
+export interface CategoryPatterns {
+  /** Category ID to associate with matches */
+  categoryId: string;
+  /** Detection patterns belonging to the category */
+  patterns: DetectionPattern[];
+}
+
 /**
  * Single match within a file
  */
@@ -108,6 +387,22 @@ export interface FileScanResult {
   warnings: string[];
 }
 
+/**
+ * Result of scanning a single file for multiple categories
+ */
+export interface MultiCategoryFileScanResult {
+  /** Path to the file */
+  filePath: string;
+  /** Detected language */
+  language: Language | null;
+  /** Pattern matches grouped by category ID */
+  matchesByCategory: Map<string, PatternMatch[]>;
+  /** Time taken to scan in milliseconds */
+  scanTimeMs: number;
+  /** Any warnings (e.g., file too large) */
+  warnings: string[];
+}
+
 /**
  * Aggregated results across multiple files
  */
@@ -169,6 +464,12 @@ export class PatternMatcher {
   private readonly log = logger.child("PatternMatcher");
   private readonly astMatcher: AstPatternMatcher;
   private astAvailable: boolean | null = null;
+  private readonly scanCache = new Map<string, ScanCacheEntry>();
+  private readonly patternSetSignatures = new WeakMap<CategoryPatterns[], string>();
+  private readonly singleCategoryWrappers = new WeakMap<
+    DetectionPattern[],
+    Map<string, CategoryPatterns[]>
+  >();
 
   constructor(options: PatternMatcherOptions = {}) {
     this.defaultOptions = {
@@ -209,9 +510,48 @@ export class PatternMatcher {
     patterns: DetectionPattern[],
     options: ScanOptions
   ): Promise<Result<FileScanResult, PinataError>> {
+    const result = await this.scanFileForCategories(
+      filePath,
+      this.getSingleCategoryWrapper(options.categoryId, patterns),
+      options
+    );
+
+    if (!result.success) {
+      return result;
+    }
+
+    const { filePath: absolutePath, language, matchesByCategory, scanTimeMs, warnings } = result.data;
+
+    return ok({
+      filePath: absolutePath,
+      language,
+      matches: matchesByCategory.get(options.categoryId) ?? [],
+      scanTimeMs,
+      warnings,
+    });
+  }
+
+  /**
+   * Scan a single file for multiple categories' patterns in one pass
+   *
+   * Stats, reads, and splits the file once, then runs every category's
+   * patterns against the same content. This keeps per-file overhead
+   * constant regardless of how many categories are being scanned.
+   *
+   * @param filePath - Path to the file to scan
+   * @param categoryPatterns - Patterns grouped by category
+   * @param options - Scan options
+   * @returns Result containing matches grouped by category ID
+   */
+  async scanFileForCategories(
+    filePath: string,
+    categoryPatterns: CategoryPatterns[],
+    options: PatternMatcherOptions = {}
+  ): Promise<Result<MultiCategoryFileScanResult, PinataError>> {
     const startTime = performance.now();
     const absolutePath = resolve(options.basePath ?? this.defaultOptions.basePath, filePath);
     const warnings: string[] = [];
+    const matchesByCategory = new Map<string, PatternMatch[]>();
 
     // Check file exists and get stats
     const statsResult = await tryCatchAsync(() => stat(absolutePath));
@@ -231,7 +571,7 @@ export class PatternMatcher {
       return ok({
         filePath: absolutePath,
         language: null,
-        matches: [],
+        matchesByCategory,
         scanTimeMs: performance.now() - startTime,
         warnings,
       });
@@ -248,44 +588,150 @@ export class PatternMatcher {
     }
 
     const content = contentResult.data;
+
+    // Reuse cached matches when neither the content nor the patterns
+    // have changed since the last scan of identical bytes. The language
+    // is part of the key: it comes from the extension, not the bytes,
+    // and identical content scanned as .py vs .js matches differently
+    const contentHash = createHash("sha256").update(content).digest("hex");
+    const cacheKey = `${language}:${this.getPatternSetSignature(categoryPatterns)}:${contentHash}`;
+    const cached = this.scanCache.get(cacheKey);
+    if (cached) {
+      return ok({
+        filePath: absolutePath,
+        language: cached.language,
+        matchesByCategory: copyMatchesByCategory(cached.matchesByCategory),
+        scanTimeMs: performance.now() - startTime,
+        warnings,
+      });
+    }
+
     const lines = content.split("\n");
+    const lineStarts = buildLineIndex(content);
+
+    for (const { categoryId, patterns } of categoryPatterns) {
+      // Filter patterns for this language
+      const applicablePatterns = patterns.filter((p) => {
+        if (language === null) return false;
+        // TypeScript patterns also apply to JavaScript files
+        if (p.language === "typescript" && language === "javascript") return true;
+        if (p.language === "javascript" && language === "typescript") return true;
+        return p.language === language;
+      });
 
-    // Filter patterns for this language
-    const applicablePatterns = patterns.filter((p) => {
-      if (language === null) return false;
-      // TypeScript patterns also apply to JavaScript files
-      if (p.language === "typescript" && language === "javascript") return true;
-      if (p.language === "javascript" && language === "typescript") return true;
-      return p.language === language;
-    });
+      if (applicablePatterns.length === 0) {
+        continue;
+      }
 
-    // Match patterns
-    const matches: PatternMatch[] = [];
+      // Match patterns
+      const matches: PatternMatch[] = [];
+
+      for (const pattern of applicablePatterns) {
+        if (pattern.type === "regex") {
+          const patternMatches = this.matchRegexPattern(pattern, content, lines, lineStarts);
+          matches.push(...patternMatches);
+        } else if (pattern.type === "ast") {
+          // AST pattern matching using tree-sitter; the content hash keys
+          // the parsed-tree cache so the file is parsed once, not per pattern
+          const astMatches = await this.matchAstPattern(
+            pattern,
+            content,
+            lines,
+            language!,
+            `${language!}:${contentHash}`
+          );
+          matches.push(...astMatches);
+        }
+        // Semantic patterns to be implemented later (LLM-assisted)
+      }
 
-    for (const pattern of applicablePatterns) {
-      if (pattern.type === "regex") {
-        const patternMatches = this.matchRegexPattern(pattern, content, lines);
-        matches.push(...patternMatches);
-      } else if (pattern.type === "ast") {
-        // AST pattern matching using tree-sitter
-        const astMatches = await this.matchAstPattern(pattern, content, lines, language!);
-        matches.push(...astMatches);
+      // Apply negative patterns to filter false positives
+      const filteredMatches = this.applyNegativePatterns(matches, content, patterns);
+      if (filteredMatches.length > 0) {
+        matchesByCategory.set(categoryId, filteredMatches);
       }
-      // Semantic patterns to be implemented later (LLM-assisted)
     }
 
-    // Apply negative patterns to filter false positives
-    const filteredMatches = this.applyNegativePatterns(matches, content, patterns);
+    // Write through to the cache, evicting the oldest entry when full
+    if (this.scanCache.size >= MAX_SCAN_CACHE_ENTRIES) {
+      const oldest = this.scanCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.scanCache.delete(oldest);
+      }
+    }
+    this.scanCache.set(cacheKey, {
+      language,
+      matchesByCategory: copyMatchesByCategory(matchesByCategory),
+    });
 
     return ok({
       filePath: absolutePath,
       language,
-      matches: filteredMatches,
+      matchesByCategory,
       scanTimeMs: performance.now() - startTime,
       warnings,
     });
   }
 
+  /**
+   * Clear the cached scan results
+   */
+  clearScanCache(): void {
+    this.scanCache.clear();
+  }
+
+  /**
+   * Get a stable CategoryPatterns wrapper for a single-category scan
+   *
+   * scanFile delegates to scanFileForCategories, whose pattern-set
+   * signature is memoized per array instance; reusing the same wrapper
+   * array across files lets that memo hit instead of re-hashing the
+   * pattern set for every file scanned.
+   */
+  private getSingleCategoryWrapper(
+    categoryId: string,
+    patterns: DetectionPattern[]
+  ): CategoryPatterns[] {
+    let byCategory = this.singleCategoryWrappers.get(patterns);
+    if (byCategory === undefined) {
+      byCategory = new Map();
+      this.singleCategoryWrappers.set(patterns, byCategory);
+    }
+
+    let wrapper = byCategory.get(categoryId);
+    if (wrapper === undefined) {
+      wrapper = [{ categoryId, patterns }];
+      byCategory.set(categoryId, wrapper);
+    }
+    return wrapper;
+  }
+
+  /**
+   * Get a stable signature for a pattern set, memoized per array instance
+   *
+   * The signature covers every pattern's id, type, language, source, and
+   * negative pattern, so any rule edit changes the scan cache key and
+   * forces a rescan.
+   */
+  private getPatternSetSignature(categoryPatterns: CategoryPatterns[]): string {
+    const cached = this.patternSetSignatures.get(categoryPatterns);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    const hash = createHash("sha256");
+    for (const { categoryId, patterns } of categoryPatterns) {
+      hash.update(categoryId);
+      for (const p of patterns) {
+        hash.update(`${p.id}:${p.type}:${p.language}:${p.pattern}:${p.negativePattern ?? ""}`);
+      }
+    }
+
+    const signature = hash.digest("hex");
+    this.patternSetSignatures.set(categoryPatterns, signature);
+    return signature;
+  }
+
   /**
    * Scan a directory recursively for pattern matches
    *
@@ -312,12 +758,16 @@ export class PatternMatcher {
     const files = filesResult.data;
     this.log.debug(`Scanning ${files.length} files in ${dirPath}`);
 
-    // Scan each file
-    for (const file of files) {
-      const scanResult = await this.scanFile(file, patterns, {
+    // Scan files with bounded concurrency, collecting in file order
+    const scanResults = await mapWithConcurrency(files, SCAN_CONCURRENCY, (file) =>
+      this.scanFile(file, patterns, {
         ...options,
         basePath: "", // Files are already absolute paths
-      });
+      })
+    );
+
+    for (const [i, scanResult] of scanResults.entries()) {
+      const file = files[i]!;
 
       if (scanResult.success) {
         warnings.push(...scanResult.data.warnings);
@@ -343,6 +793,70 @@ export class PatternMatcher {
     return ok(results);
   }
 
+  /**
+   * Scan a directory once for multiple categories' patterns
+   *
+   * Walks the tree and reads each file a single time, running every
+   * category's patterns against the content, instead of repeating the
+   * walk and the file reads once per category.
+   *
+   * @param dirPath - Path to the directory to scan
+   * @param categoryPatterns - Patterns grouped by category
+   * @param options - Scan options
+   * @returns Result containing array of DetectionResults or an error
+   */
+  async scanDirectoryForCategories(
+    dirPath: string,
+    categoryPatterns: CategoryPatterns[],
+    options: PatternMatcherOptions = {}
+  ): Promise<Result<DetectionResult[], PinataError>> {
+    const absolutePath = resolve(options.basePath ?? this.defaultOptions.basePath, dirPath);
+    const results: DetectionResult[] = [];
+    const warnings: string[] = [];
+
+    // Get all files recursively
+    const filesResult = await this.getFilesRecursive(absolutePath, 0, options);
+    if (!filesResult.success) {
+      return err(filesResult.error);
+    }
+
+    const files = filesResult.data;
+    this.log.debug(
+      `Scanning ${files.length} files in ${dirPath} for ${categoryPatterns.length} categories`
+    );
+
+    // Scan each file once for all categories, with bounded concurrency
+    const scanResults = await mapWithConcurrency(files, SCAN_CONCURRENCY, (file) =>
+      this.scanFileForCategories(file, categoryPatterns, {
+        ...options,
+        basePath: "", // Files are already absolute paths
+      })
+    );
+
+    for (const [i, scanResult] of scanResults.entries()) {
+      const file = files[i]!;
+
+      if (scanResult.success) {
+        warnings.push(...scanResult.data.warnings);
+
+        // Convert matches to DetectionResults
+        for (const [categoryId, matches] of scanResult.data.matchesByCategory) {
+          for (const match of matches) {
+            results.push(this.matchToDetectionResult(match, file, categoryId));
+          }
+        }
+      } else {
+        warnings.push(`Error scanning ${file}: ${scanResult.error.message}`);
+      }
+    }
+
+    if (warnings.length > 0) {
+      this.log.warn(`Scan completed with ${warnings.length} warnings`);
+    }
+
+    return ok(results);
+  }
+
   /**
    * Aggregate detection results for analysis
    *
@@ -404,22 +918,37 @@ export class PatternMatcher {
   private matchRegexPattern(
     pattern: DetectionPattern,
     content: string,
-    lines: string[]
+    lines: string[],
+    lineStarts: number[]
   ): PatternMatch[] {
     const matches: PatternMatch[] = [];
 
+    // Cheap literal prefilter: if a substring required by the pattern is
+    // absent, the regex cannot match and never needs to run
+    const requiredLiteral = getRequiredLiteral(pattern.pattern);
+    if (requiredLiteral !== null && !content.includes(requiredLiteral)) {
+      return matches;
+    }
+
+    // Look up the compiled regex (global + multiline flags); invalid
+    // sources were already warned about when first compiled
+    const regex = getCompiledRegex(pattern.pattern, "gm");
+    if (regex === null) {
+      return matches;
+    }
+
     try {
-      // Create regex with global and multiline flags
-      const regex = new RegExp(pattern.pattern, "gm");
+      // Reset state from any previous scan (global regexes track lastIndex)
+      regex.lastIndex = 0;
       let match: RegExpExecArray | null;
 
       while ((match = regex.exec(content)) !== null) {
-        // Calculate line number from offset
-        const lineStart = this.getLineNumber(content, match.index);
-        const lineEnd = this.getLineNumber(content, match.index + match[0].length);
+        // Translate match offsets to line numbers via the offset table
+        const lineStart = lineFromOffset(lineStarts, match.index);
+        const lineEnd = lineFromOffset(lineStarts, match.index + match[0].length);
 
         // Get column positions
-        const lineStartOffset = this.getLineStartOffset(content, match.index);
+        const lineStartOffset = lineStarts[lineStart - 1]!;
         const columnStart = match.index - lineStartOffset;
         const columnEnd = columnStart + match[0].length;
 
@@ -442,7 +971,7 @@ export class PatternMatcher {
         }
       }
     } catch (e) {
-      this.log.warn(`Invalid regex pattern '${pattern.id}': ${e}`);
+      this.log.warn(`Regex pattern error '${pattern.id}': ${e}`);
     }
 
     return matches;
@@ -459,13 +988,15 @@ export class PatternMatcher {
    * @param content File content
    * @param lines File content split into lines
    * @param language Programming language
+   * @param cacheKey Cache key for the parsed AST (reused across patterns)
    * @returns Array of pattern matches
    */
   private async matchAstPattern(
     pattern: DetectionPattern,
     content: string,
     lines: string[],
-    language: Language
+    language: Language,
+    cacheKey?: string
   ): Promise<PatternMatch[]> {
     const matches: PatternMatch[] = [];
 
@@ -476,7 +1007,7 @@ export class PatternMatcher {
     }
 
     try {
-      const astResult = await this.astMatcher.query(content, pattern.pattern, language);
+      const astResult = await this.astMatcher.query(content, pattern.pattern, language, cacheKey);
 
       if (!astResult.success) {
         this.log.warn(`AST query failed for pattern '${pattern.id}': ${astResult.error.message}`);
@@ -565,14 +1096,14 @@ export class PatternMatcher {
       const negativePattern = match.pattern.negativePattern;
       if (!negativePattern) return true;
 
-      try {
-        const negativeRegex = new RegExp(negativePattern);
-        // Check if the matched code or surrounding context matches the negative pattern
-        const surroundingCode = this.getSurroundingCode(content, match);
-        return !negativeRegex.test(surroundingCode);
-      } catch {
+      const negativeRegex = getCompiledRegex(negativePattern, "");
+      if (negativeRegex === null) {
         return true; // Invalid negative pattern, keep the match
       }
+
+      // Check if the matched code or surrounding context matches the negative pattern
+      const surroundingCode = this.getSurroundingCode(content, match);
+      return !negativeRegex.test(surroundingCode);
     });
   }
 
@@ -586,30 +1117,6 @@ export class PatternMatcher {
     return lines.slice(startLine, endLine).join("\n");
   }
 
-  /**
-   * Get line number from character offset
-   */
-  private getLineNumber(content: string, offset: number): number {
-    let line = 1;
-    for (let i = 0; i < offset && i < content.length; i++) {
-      if (content[i] === "\n") {
-        line++;
-      }
-    }
-    return line;
-  }
-
-  /**
-   * Get the character offset of the start of the line containing the given offset
-   */
-  private getLineStartOffset(content: string, offset: number): number {
-    let lineStart = offset;
-    while (lineStart > 0 && content[lineStart - 1] !== "\n") {
-      lineStart--;
-    }
-    return lineStart;
-  }
-
   /**
    * Build a code snippet with context around the match
    */
@@ -177,28 +177,27 @@ export class Scanner {
     const testFiles = new Set<string>();
     const sourceFiles = new Set<string>();
 
-    // Scan for each category
-    for (const category of categories) {
-      const scanResult = await this.patternMatcher.scanDirectory(
-        targetDirectory,
-        category.detectionPatterns,
-        {
-          categoryId: category.id,
-          basePath: targetDirectory,
-          excludeDirs: opts.excludeDirs,
-          includeExtensions: opts.includeExtensions,
-          maxFileSize: opts.maxFileSize,
-          maxDepth: opts.maxDepth,
-        }
-      );
-
-      if (!scanResult.success) {
-        warnings.push(`Failed to scan for category ${category.id}: ${scanResult.error.message}`);
-        continue;
+    // Scan all categories in a single pass over the tree (one read per file)
+    const categoryById = new Map(categories.map((c) => [c.id, c]));
+    const scanResult = await this.patternMatcher.scanDirectoryForCategories(
+      targetDirectory,
+      categories.map((c) => ({ categoryId: c.id, patterns: c.detectionPatterns })),
+      {
+        basePath: targetDirectory,
+        excludeDirs: opts.excludeDirs,
+        includeExtensions: opts.includeExtensions,
+        maxFileSize: opts.maxFileSize,
+        maxDepth: opts.maxDepth,
       }
+    );
 
+    if (!scanResult.success) {
+      warnings.push(`Failed to scan categories: ${scanResult.error.message}`);
+    } else {
       // Filter by severity and confidence
       const filtered = scanResult.data.filter((d) => {
+        const category = categoryById.get(d.categoryId);
+        if (!category) return false;
         const severityOk = SEVERITY_ORDER[category.severity] >= SEVERITY_ORDER[opts.minSeverity];
         const confidenceOk = CONFIDENCE_ORDER[d.confidence] >= CONFIDENCE_ORDER[opts.minConfidence];
         return severityOk && confidenceOk;
@@ -8,27 +8,44 @@
  * - Overall F1 score
  */
 
-import { readFile } from "fs/promises";
 import { resolve, relative } from "path";
 
 import { describe, it, expect, beforeAll } from "vitest";
 
 import { CategoryStore } from "@/categories/store/category-store.js";
 import { Scanner } from "@/core/scanner/scanner.js";
+import { loadCorpusRecords, toManifest } from "@tests/helpers/corpus-loader.js";
 
-import type { Gap } from "@/core/scanner/types.js";
+import type { Gap, ScanResult } from "@/core/scanner/types.js";
+import type { PinataError } from "@/lib/errors.js";
+import type { Result } from "@/lib/result.js";
+import type { ExpectedDetection } from "@tests/helpers/corpus-loader.js";
 
 const CORPUS_DIR = resolve(__dirname, "../corpus");
 const DEFINITIONS_PATH = resolve(__dirname, "../../src/categories/definitions");
 
-interface ExpectedDetection {
-  category: string;
-  line: number;
-  patternId: string;
-}
-
 type Manifest = Record<string, ExpectedDetection[]>;
 
+/**
+ * Index manifest entries by category so per-category checks only visit
+ * the files labeled with that category instead of the whole corpus.
+ */
+function buildCorpusIndex(manifest: Manifest): Map<string, string[]> {
+  const index = new Map<string, string[]>();
+
+  for (const [filePath, expected] of Object.entries(manifest)) {
+    for (const exp of expected) {
+      const files = index.get(exp.category) ?? [];
+      if (!files.includes(filePath)) {
+        files.push(filePath);
+      }
+      index.set(exp.category, files);
+    }
+  }
+
+  return index;
+}
+
 interface AccuracyMetrics {
   truePositives: number;
   falsePositives: number;
@@ -46,20 +63,26 @@ describe("Accuracy Tests", () => {
   let store: CategoryStore;
   let scanner: Scanner;
   let manifest: Manifest;
+  let vulnerableResult: Result<ScanResult, PinataError>;
+  let safeResult: Result<ScanResult, PinataError>;
 
   beforeAll(async () => {
     store = new CategoryStore();
     await store.loadFromDirectory(DEFINITIONS_PATH);
     scanner = new Scanner(store);
 
-    const manifestContent = await readFile(resolve(CORPUS_DIR, "manifest.json"), "utf8");
-    manifest = JSON.parse(manifestContent) as Manifest;
+    // Load the flattened corpus manifest in one read (npm run corpus:build)
+    manifest = toManifest(await loadCorpusRecords());
+
+    // Scan each half of the corpus once and share the results across
+    // tests; rescanning per test re-reads every fixture for no benefit
+    vulnerableResult = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable"));
+    safeResult = await scanner.scanDirectory(resolve(CORPUS_DIR, "safe"));
   });
 
   describe("vulnerable corpus detection", () => {
-    it("detects vulnerabilities in labeled samples", async () => {
-      const vulnerableDir = resolve(CORPUS_DIR, "vulnerable");
-      const result = await scanner.scanDirectory(vulnerableDir);
+    it("detects vulnerabilities in labeled samples", () => {
+      const result = vulnerableResult;
 
       expect(result.success).toBe(true);
       if (result.success) {
@@ -68,9 +91,8 @@ describe("Accuracy Tests", () => {
       }
     });
 
-    it("achieves >80% recall on labeled vulnerabilities", async () => {
-      const vulnerableDir = resolve(CORPUS_DIR, "vulnerable");
-      const result = await scanner.scanDirectory(vulnerableDir);
+    it("achieves >80% recall on labeled vulnerabilities", () => {
+      const result = vulnerableResult;
 
       expect(result.success).toBe(true);
       if (!result.success) return;
@@ -109,9 +131,8 @@ describe("Accuracy Tests", () => {
   });
 
   describe("safe corpus false positive rate", () => {
-    it("produces minimal false positives in safe code", async () => {
-      const safeDir = resolve(CORPUS_DIR, "safe");
-      const result = await scanner.scanDirectory(safeDir);
+    it("produces minimal false positives in safe code", () => {
+      const result = safeResult;
 
       expect(result.success).toBe(true);
       if (!result.success) return;
@@ -126,9 +147,8 @@ describe("Accuracy Tests", () => {
       expect(falsePositives).toBeLessThan(safeFiles * 15); // High threshold to track improvement
     });
 
-    it("validates each safe file has no critical false positives", async () => {
-      const safeDir = resolve(CORPUS_DIR, "safe");
-      const result = await scanner.scanDirectory(safeDir);
+    it("validates each safe file has no critical false positives", () => {
+      const result = safeResult;
 
       expect(result.success).toBe(true);
       if (!result.success) return;
@@ -149,32 +169,31 @@ describe("Accuracy Tests", () => {
   });
 
   describe("per-category metrics", () => {
-    it("calculates precision/recall for each category", async () => {
-      const vulnerableDir = resolve(CORPUS_DIR, "vulnerable");
-      const result = await scanner.scanDirectory(vulnerableDir);
+    it("calculates precision/recall for each category", () => {
+      const result = vulnerableResult;
 
       expect(result.success).toBe(true);
       if (!result.success) return;
 
       const categoryMetrics = new Map<string, { expected: number; detected: number; fp: number }>();
 
-      // Initialize categories
-      for (const expected of Object.values(manifest).flat()) {
-        if (!categoryMetrics.has(expected.category)) {
-          categoryMetrics.set(expected.category, { expected: 0, detected: 0, fp: 0 });
-        }
-      }
+      // Count expected and detected per category bucket from the index,
+      // visiting only the files labeled with each category
+      const corpusIndex = buildCorpusIndex(manifest);
 
-      // Count expected and detected
-      for (const [filePath, expected] of Object.entries(manifest)) {
-        if (!filePath.startsWith("vulnerable/")) continue;
+      for (const [category, files] of corpusIndex) {
+        const metrics = { expected: 0, detected: 0, fp: 0 };
+        categoryMetrics.set(category, metrics);
 
-        const fullPath = resolve(CORPUS_DIR, filePath);
-        const fileGaps = result.data.gaps.filter((g) => g.filePath === fullPath);
+        for (const filePath of files) {
+          if (!filePath.startsWith("vulnerable/")) continue;
+
+          const fullPath = resolve(CORPUS_DIR, filePath);
+          const fileGaps = result.data.gaps.filter((g) => g.filePath === fullPath);
+
+          for (const exp of manifest[filePath] ?? []) {
+            if (exp.category !== category) continue;
 
-        for (const exp of expected) {
-          const metrics = categoryMetrics.get(exp.category);
-          if (metrics) {
             metrics.expected++;
             const found = fileGaps.some(
               (g) => g.categoryId === exp.category && Math.abs(g.lineStart - exp.line) <= 2
@@ -202,11 +221,7 @@ describe("Accuracy Tests", () => {
   });
 
   describe("overall F1 score", () => {
-    it("calculates overall F1 score", async () => {
-      // Scan both vulnerable and safe directories
-      const vulnerableResult = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable"));
-      const safeResult = await scanner.scanDirectory(resolve(CORPUS_DIR, "safe"));
-
+    it("calculates overall F1 score", () => {
       expect(vulnerableResult.success).toBe(true);
       expect(safeResult.success).toBe(true);
 
@@ -265,7 +280,9 @@ describe("Detection Quality", () => {
   });
 
   it("detects SQL injection in f-string queries", async () => {
-    const result = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable/sql-injection"));
+    const result = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable/sql-injection"), {
+      categoryIds: ["sql-injection"],
+    });
 
     expect(result.success).toBe(true);
     if (result.success) {
@@ -275,7 +292,9 @@ describe("Detection Quality", () => {
   });
 
   it("detects XSS via innerHTML", async () => {
-    const result = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable/xss"));
+    const result = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable/xss"), {
+      categoryIds: ["xss"],
+    });
 
     expect(result.success).toBe(true);
     if (result.success) {
@@ -285,7 +304,9 @@ describe("Detection Quality", () => {
   });
 
   it("detects command injection", async () => {
-    const result = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable/command-injection"));
+    const result = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable/command-injection"), {
+      categoryIds: ["command-injection"],
+    });
 
     expect(result.success).toBe(true);
     if (result.success) {
@@ -295,7 +316,9 @@ describe("Detection Quality", () => {
   });
 
   it("detects hardcoded secrets", async () => {
-    const result = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable/hardcoded-secrets"));
+    const result = await scanner.scanDirectory(resolve(CORPUS_DIR, "vulnerable/hardcoded-secrets"), {
+      categoryIds: ["hardcoded-secrets"],
+    });
 
     expect(result.success).toBe(true);
     if (result.success) {
@@ -0,0 +1,88 @@
+/**
+ * Freshness guard for the generated corpus.jsonl.
+ *
+ * The accuracy suite takes expected detections (and the concatenated
+ * safe-corpus scan its sources) from corpus.jsonl, while the scanner
+ * scans the real fixture files on disk. If a fixture or manifest.json
+ * is edited without rerunning `npm run corpus:build`, new scans would
+ * silently be evaluated against stale expectations — this suite makes
+ * that drift fail loudly instead.
+ */
+
+import { readFile, readdir } from "fs/promises";
+import { join, relative, resolve } from "path";
+
+import { describe, it, expect, beforeAll } from "vitest";
+
+import { loadCorpusRecords } from "@tests/helpers/corpus-loader.js";
+
+import type { CorpusRecord, ExpectedDetection } from "@tests/helpers/corpus-loader.js";
+
+const CORPUS_DIR = resolve(__dirname, "../corpus");
+
+const REBUILD_HINT = "corpus.jsonl is stale — run: npm run corpus:build";
+
+/**
+ * Fixture extensions included in the corpus (matches the build script)
+ */
+const FIXTURE_EXTENSIONS = [".py", ".ts", ".tsx", ".js", ".jsx"];
+
+async function collectFixtures(dir: string): Promise<string[]> {
+  const entries = await readdir(dir, { withFileTypes: true });
+  const files: string[] = [];
+
+  for (const entry of entries) {
+    const fullPath = join(dir, entry.name);
+    if (entry.isDirectory()) {
+      files.push(...(await collectFixtures(fullPath)));
+    } else if (FIXTURE_EXTENSIONS.some((ext) => entry.name.endsWith(ext))) {
+      files.push(fullPath);
+    }
+  }
+
+  return files;
+}
+
+describe("corpus.jsonl freshness", () => {
+  let records: CorpusRecord[];
+  let manifest: Record<string, ExpectedDetection[]>;
+
+  beforeAll(async () => {
+    records = await loadCorpusRecords();
+    const manifestContent = await readFile(resolve(CORPUS_DIR, "manifest.json"), "utf8");
+    manifest = JSON.parse(manifestContent) as Record<string, ExpectedDetection[]>;
+  });
+
+  it("covers every fixture on disk", async () => {
+    const safeFiles = await collectFixtures(resolve(CORPUS_DIR, "safe"));
+    const vulnerableFiles = await collectFixtures(resolve(CORPUS_DIR, "vulnerable"));
+    const onDisk = [...safeFiles, ...vulnerableFiles]
+      .map((f) => relative(CORPUS_DIR, f).split("\\").join("/"))
+      .sort();
+
+    const recordPaths = records.map((r) => r.path).sort();
+
+    expect(recordPaths, REBUILD_HINT).toEqual(onDisk);
+  });
+
+  it("embeds sources that match the fixtures on disk", async () => {
+    for (const record of records) {
+      const onDisk = await readFile(resolve(CORPUS_DIR, record.path), "utf8");
+      expect(record.source, `${record.path}: ${REBUILD_HINT}`).toBe(onDisk);
+    }
+  });
+
+  it("embeds expected detections that match manifest.json", () => {
+    for (const record of records) {
+      expect(record.expected, `${record.path}: ${REBUILD_HINT}`).toEqual(
+        manifest[record.path] ?? []
+      );
+    }
+
+    // Every manifest entry must also correspond to a record
+    for (const manifestPath of Object.keys(manifest)) {
+      const record = records.find((r) => r.path === manifestPath);
+      expect(record, `${manifestPath}: ${REBUILD_HINT}`).toBeDefined();
+    }
+  });
+});
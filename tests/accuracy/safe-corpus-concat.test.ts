@@ -0,0 +1,101 @@
+/**
+ * Single-pass scan over the concatenated safe corpus.
+ *
+ * Joins all safe fixtures of each extension into one synthetic file and
+ * scans the result once, so the safe half of the corpus pays per-file
+ * scanner overhead (stat, read, parse setup) once per extension instead
+ * of once per fixture. Thresholds mirror the per-file safe-corpus tests
+ * in accuracy.test.ts, which remain the per-fixture source of truth.
+ */
+
+import { mkdtemp, rm, writeFile } from "fs/promises";
+import { tmpdir } from "os";
+import { join, resolve } from "path";
+
+import { describe, it, expect, beforeAll, afterAll } from "vitest";
+
+import { CategoryStore } from "@/categories/store/category-store.js";
+import { Scanner } from "@/core/scanner/scanner.js";
+import { loadCorpusRecords } from "@tests/helpers/corpus-loader.js";
+
+import type { ScanResult } from "@/core/scanner/types.js";
+import type { PinataError } from "@/lib/errors.js";
+import type { Result } from "@/lib/result.js";
+
+const DEFINITIONS_PATH = resolve(__dirname, "../../src/categories/definitions");
+
+/**
+ * Fixture extensions accepted by the corpus build script, with the
+ * comment syntax used as the concatenation separator for each
+ */
+const FIXTURE_EXTENSIONS: Record<string, string> = {
+  ".py": "\n# ===\n",
+  ".ts": "\n// ===\n",
+  ".tsx": "\n// ===\n",
+  ".js": "\n// ===\n",
+  ".jsx": "\n// ===\n",
+};
+
+describe("Safe corpus single-pass scan", () => {
+  let scanDir: string;
+  let safeFileCount = 0;
+  let blobCount = 0;
+  let result: Result<ScanResult, PinataError>;
+
+  beforeAll(async () => {
+    const records = await loadCorpusRecords();
+    const safeRecords = records.filter((r) => r.label === "safe");
+
+    scanDir = await mkdtemp(join(tmpdir(), "pinata-safe-corpus-"));
+
+    // Concatenate fixtures per extension with separator markers so the
+    // scanner sees one file per extension instead of one per fixture.
+    // Every extension the corpus build accepts gets a blob, and the
+    // false-positive budget counts only fixtures actually embedded
+    for (const [ext, separator] of Object.entries(FIXTURE_EXTENSIONS)) {
+      const extRecords = safeRecords.filter((r) => r.path.endsWith(ext));
+      if (extRecords.length === 0) continue;
+
+      const blob = extRecords.map((r) => r.source).join(separator);
+      await writeFile(join(scanDir, `safe_corpus_concat${ext}`), blob, "utf8");
+      safeFileCount += extRecords.length;
+      blobCount++;
+    }
+
+    const store = new CategoryStore();
+    await store.loadFromDirectory(DEFINITIONS_PATH);
+    const scanner = new Scanner(store);
+
+    result = await scanner.scanDirectory(scanDir);
+  });
+
+  afterAll(async () => {
+    await rm(scanDir, { recursive: true, force: true });
+  });
+
+  it("scans the concatenated safe corpus successfully", () => {
+    expect(result.success).toBe(true);
+    if (result.success) {
+      expect(result.data.fileStats.totalFiles).toBe(blobCount);
+    }
+  });
+
+  it("stays within the safe-corpus false positive budget", () => {
+    expect(result.success).toBe(true);
+    if (!result.success) return;
+
+    const falsePositives = result.data.gaps.length;
+    console.log(`  False positives in concatenated safe corpus (${safeFileCount} fixtures): ${falsePositives}`);
+
+    // Same budget as the per-file safe corpus test (task 2.8 tracks tuning)
+    expect(falsePositives).toBeLessThan(safeFileCount * 15);
+  });
+
+  it("produces no critical false positives beyond the tracked budget", () => {
+    expect(result.success).toBe(true);
+    if (!result.success) return;
+
+    const criticalFP = result.data.gaps.filter((g) => g.severity === "critical");
+    expect(criticalFP.length).toBeLessThan(50);
+  });
+});
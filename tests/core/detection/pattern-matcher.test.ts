@@ -8,6 +8,7 @@ import {
   PatternMatcher,
   createPatternMatcher,
   detectLanguage,
+  extractRequiredLiteral,
   getSupportedExtensions,
   isExtensionSupported,
 } from "../../../src/core/detection/pattern-matcher.js";
@@ -560,6 +561,49 @@ describe("PatternMatcher", () => {
     });
   });
 
+  describe("extractRequiredLiteral", () => {
+    it("extracts a plain literal pattern", () => {
+      expect(extractRequiredLiteral("dangerouslySetInnerHTML")).toBe("dangerouslySetInnerHTML");
+    });
+
+    it("extracts the literal part around escaped punctuation", () => {
+      expect(extractRequiredLiteral("render_template_string\\s*\\(")).toBe(
+        "render_template_string"
+      );
+      expect(extractRequiredLiteral("\\.innerHTML\\s*=")).toBe(".innerHTML");
+    });
+
+    it("returns null for alternation patterns", () => {
+      expect(extractRequiredLiteral("(query|execute|run)\\s*\\(")).toBeNull();
+    });
+
+    it("does not treat group contents as guaranteed", () => {
+      // (def)? is optional, so "def" must not be extracted
+      expect(extractRequiredLiteral("abcdef(ghijkl)?")).toBe("abcdef");
+    });
+
+    it("drops characters made optional by quantifiers", () => {
+      expect(extractRequiredLiteral("pickle\\.loads?")).toBe("pickle.load");
+    });
+
+    it("returns null when no literal is long enough", () => {
+      expect(extractRequiredLiteral("\\d+\\s*\\w+")).toBeNull();
+      expect(extractRequiredLiteral("a.b.c")).toBeNull();
+    });
+
+    it("breaks runs at character classes", () => {
+      expect(extractRequiredLiteral("yaml\\.load[^(]*\\(")).toBe("yaml.load");
+    });
+
+    it("returns null for multi-character escapes and backreferences", () => {
+      // The escape operand spans following characters, so they must not
+      // be misread as literal text
+      expect(extractRequiredLiteral("\\u0041bcdef")).toBeNull();
+      expect(extractRequiredLiteral("\\x41bcdef")).toBeNull();
+      expect(extractRequiredLiteral("(abc)(def)\\12ghi")).toBeNull();
+    });
+  });
+
   describe("isExtensionSupported", () => {
     it("returns true for supported extensions", () => {
       expect(isExtensionSupported(".py")).toBe(true);
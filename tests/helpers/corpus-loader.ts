@@ -0,0 +1,54 @@
+/**
+ * Loader for the flattened corpus manifest (corpus.jsonl)
+ *
+ * corpus.jsonl is generated from the fixture files and manifest.json by
+ * `npm run corpus:build`. Loading it gives tests the whole labeled
+ * corpus — paths, labels, expected detections, and sources — in a
+ * single sequential read.
+ */
+
+import { readFile } from "fs/promises";
+import { resolve } from "path";
+
+export interface ExpectedDetection {
+  category: string;
+  line: number;
+  patternId: string;
+}
+
+export interface CorpusRecord {
+  /** Path relative to tests/corpus, POSIX-style (matches manifest keys) */
+  path: string;
+  /** Whether the fixture is a labeled-safe or labeled-vulnerable sample */
+  label: "safe" | "vulnerable";
+  /** Expected detections from manifest.json (empty for safe fixtures) */
+  expected: ExpectedDetection[];
+  /** Full fixture source */
+  source: string;
+}
+
+const CORPUS_JSONL_PATH = resolve(__dirname, "../corpus/corpus.jsonl");
+
+/**
+ * Load all corpus records from corpus.jsonl
+ */
+export async function loadCorpusRecords(): Promise<CorpusRecord[]> {
+  const content = await readFile(CORPUS_JSONL_PATH, "utf8");
+
+  return content
+    .split("\n")
+    .filter((line) => line.length > 0)
+    .map((line) => JSON.parse(line) as CorpusRecord);
+}
+
+/**
+ * Build the manifest-shaped lookup (path -> expected detections) from
+ * corpus records, for tests that key off file paths
+ */
+export function toManifest(records: CorpusRecord[]): Record<string, ExpectedDetection[]> {
+  const manifest: Record<string, ExpectedDetection[]> = {};
+  for (const record of records) {
+    manifest[record.path] = record.expected;
+  }
+  return manifest;
+}